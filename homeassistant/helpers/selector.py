@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
+from sys import intern
 from typing import Any, TypedDict, cast
+from weakref import WeakValueDictionary
 
 import voluptuous as vol
 
 from homeassistant.backports.enum import StrEnum
 from homeassistant.const import CONF_MODE, CONF_UNIT_OF_MEASUREMENT
-from homeassistant.core import split_entity_id, valid_entity_id
+from homeassistant.core import valid_entity_id
 from homeassistant.util import decorator
 from homeassistant.util.yaml.dumper import add_representer, represent_odict
 
@@ -16,48 +18,90 @@ from . import config_validation as cv
 
 SELECTORS: decorator.Registry[str, type[Selector]] = decorator.Registry()
 
+_SELECTOR_INSTANCE_CACHE: WeakValueDictionary[
+    tuple[type[Selector], frozenset[tuple[str, Any, type]]], Selector
+] = WeakValueDictionary()
 
-def _get_selector_class(config: Any) -> type[Selector]:
-    """Get selector class type."""
+# Compiled once so selectors don't rebuild it on every validation
+_STRING_SCHEMA = vol.Schema(str)
+
+
+def _get_selector_class(config: Any) -> tuple[type[Selector], str]:
+    """Get selector class type and the type it was registered under."""
     if not isinstance(config, dict):
         raise vol.Invalid("Expected a dictionary")
 
-    if len(config) != 1:
-        raise vol.Invalid(f"Only one type can be specified. Found {', '.join(config)}")
+    try:
+        # Raises ValueError unless there is exactly one key
+        ((selector_type, _),) = config.items()
+    except ValueError:
+        raise vol.Invalid(
+            f"Only one type can be specified. Found {', '.join(config)}"
+        ) from None
 
-    selector_type: str = list(config)[0]
+    if type(selector_type) is str:
+        # Interning matches the dispatch dict's literal keys by identity
+        selector_type = intern(selector_type)
 
-    if (selector_class := SELECTORS.get(selector_type)) is None:
-        raise vol.Invalid(f"Unknown selector type {selector_type} found")
+    if (selector_class := _dispatch_get(selector_type)) is None:
+        # Selectors registered after import (tests, custom code) are not in
+        # the dispatch snapshot; pick them up from the registry once.
+        if (selector_class := SELECTORS.get(selector_type)) is None:
+            raise vol.Invalid(f"Unknown selector type {selector_type} found")
+        _SELECTOR_DISPATCH[selector_type] = selector_class
 
-    return selector_class
+    return selector_class, selector_type
 
 
 def selector(config: Any) -> Selector:
     """Instantiate a selector."""
-    selector_class = _get_selector_class(config)
-    selector_type = list(config)[0]
+    selector_class, selector_type = _get_selector_class(config)
+    selector_config = config[selector_type]
+
+    # Selectors can be empty
+    if selector_config is None and hasattr(selector_class, "_EMPTY_CONFIG"):
+        return selector_class._from_empty()  # pylint: disable=protected-access
 
-    return selector_class(config[selector_type])
+    return selector_class.from_config(selector_config)
 
 
 def validate_selector(config: Any) -> dict:
     """Validate a selector."""
-    selector_class = _get_selector_class(config)
-    selector_type = list(config)[0]
+    selector_class, selector_type = _get_selector_class(config)
 
     # Selectors can be empty
     if config[selector_type] is None:
         return {selector_type: {}}
 
-    return {
-        selector_type: cast(dict, selector_class.CONFIG_SCHEMA(config[selector_type]))
-    }
+    return {selector_type: selector_class.CONFIG_SCHEMA(config[selector_type])}
+
+
+class _SelectorMeta(type):
+    """Metaclass that compiles selector schemas on first access.
+
+    Schemas are declared as _build_* staticmethods so the voluptuous
+    compilation only runs for selectors actually used, not for every
+    class at import time. The compiled schema is cached on the class.
+    """
+
+    def __getattr__(cls, name: str) -> Any:
+        """Compile, cache and return a lazily built schema."""
+        if name.isupper() and (
+            builder := getattr(cls, f"_build_{name.lower()}", None)
+        ):
+            schema = builder()
+            setattr(cls, name, schema)
+            return schema
+        raise AttributeError(
+            f"type object {cls.__name__!r} has no attribute {name!r}"
+        )
 
 
-class Selector:
+class Selector(metaclass=_SelectorMeta):
     """Base class for selectors."""
 
+    __slots__ = ("config", "__weakref__")
+
     CONFIG_SCHEMA: Callable
     config: Any
     selector_type: str
@@ -68,7 +112,51 @@ class Selector:
         if config is None:
             config = {}
 
-        self.config = self.CONFIG_SCHEMA(config)
+        self.config = type(self).CONFIG_SCHEMA(config)
+
+    @classmethod
+    def _from_empty(cls) -> Selector:
+        """Instantiate a selector from an empty config, skipping validation.
+
+        Only used by classes exposing _EMPTY_CONFIG, whose config schema
+        validates an empty config to an empty dict and whose __init__
+        keeps no other state.
+        """
+        instance = cls.__new__(cls)
+        # A fresh dict per instance: config is exposed through serialize()
+        # and must not be shared; only the schema call is skipped.
+        instance.config = {}
+        return instance
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> Selector:
+        """Instantiate a selector, reusing a cached instance when possible.
+
+        Selectors are immutable once validated, so repeated instantiations
+        from the same config can share a single instance.
+        """
+        # Selectors can be empty
+        if config is None:
+            config = {}
+
+        try:
+            # Value types are part of the key: True == 1 == 1.0 hash alike,
+            # but the schemas distinguish bool from int/float.
+            cache_key = (
+                cls,
+                frozenset((key, value, type(value)) for key, value in config.items()),
+            )
+        except (AttributeError, TypeError):
+            # Not a dict, or the config holds unhashable values (e.g. lists);
+            # fall back to an uncached instance.
+            return cls(config)
+
+        if (cached := _SELECTOR_INSTANCE_CACHE.get(cache_key)) is not None:
+            return cached
+
+        instance = cls(config)
+        _SELECTOR_INSTANCE_CACHE[cache_key] = instance
+        return instance
 
     def serialize(self) -> Any:
         """Serialize Selector for voluptuous_serialize."""
@@ -126,9 +214,17 @@ class ActionSelectorConfig(TypedDict):
 class ActionSelector(Selector):
     """Selector of an action sequence (script syntax)."""
 
+    __slots__ = ()
+
     selector_type = "action"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
 
     def __init__(self, config: ActionSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -150,14 +246,20 @@ class AddonSelectorConfig(TypedDict, total=False):
 class AddonSelector(Selector):
     """Selector of a add-on."""
 
+    __slots__ = ()
+
     selector_type = "addon"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {
-            vol.Optional("name"): str,
-            vol.Optional("slug"): str,
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {
+                vol.Optional("name"): str,
+                vol.Optional("slug"): str,
+            }
+        )
+        return schema
 
     def __init__(self, config: AddonSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -165,7 +267,7 @@ class AddonSelector(Selector):
 
     def __call__(self, data: Any) -> str:
         """Validate the passed selection."""
-        addon: str = vol.Schema(str)(data)
+        addon: str = _STRING_SCHEMA(data)
         return addon
 
 
@@ -181,28 +283,35 @@ class AreaSelectorConfig(TypedDict, total=False):
 class AreaSelector(Selector):
     """Selector of a single or list of areas."""
 
+    __slots__ = ("_multiple",)
+
     selector_type = "area"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {
-            vol.Optional("entity"): SINGLE_ENTITY_SELECTOR_CONFIG_SCHEMA,
-            vol.Optional("device"): SINGLE_DEVICE_SELECTOR_CONFIG_SCHEMA,
-            vol.Optional("multiple", default=False): cv.boolean,
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {
+                vol.Optional("entity"): SINGLE_ENTITY_SELECTOR_CONFIG_SCHEMA,
+                vol.Optional("device"): SINGLE_DEVICE_SELECTOR_CONFIG_SCHEMA,
+                vol.Optional("multiple", default=False): cv.boolean,
+            }
+        )
+        return schema
 
     def __init__(self, config: AreaSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
         super().__init__(config)
+        self._multiple: bool = self.config["multiple"]
 
     def __call__(self, data: Any) -> str | list[str]:
         """Validate the passed selection."""
-        if not self.config["multiple"]:
-            area_id: str = vol.Schema(str)(data)
+        if not self._multiple:
+            area_id: str = _STRING_SCHEMA(data)
             return area_id
         if not isinstance(data, list):
             raise vol.Invalid("Value should be a list")
-        return [vol.Schema(str)(val) for val in data]
+        return list(map(_STRING_SCHEMA, data))
 
 
 class AttributeSelectorConfig(TypedDict):
@@ -215,9 +324,15 @@ class AttributeSelectorConfig(TypedDict):
 class AttributeSelector(Selector):
     """Selector for an entity attribute."""
 
+    __slots__ = ()
+
     selector_type = "attribute"
 
-    CONFIG_SCHEMA = vol.Schema({vol.Required("entity_id"): cv.entity_id})
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({vol.Required("entity_id"): cv.entity_id})
+        return schema
 
     def __init__(self, config: AttributeSelectorConfig) -> None:
         """Instantiate a selector."""
@@ -225,7 +340,7 @@ class AttributeSelector(Selector):
 
     def __call__(self, data: Any) -> str:
         """Validate the passed selection."""
-        attribute: str = vol.Schema(str)(data)
+        attribute: str = _STRING_SCHEMA(data)
         return attribute
 
 
@@ -237,9 +352,17 @@ class BooleanSelectorConfig(TypedDict):
 class BooleanSelector(Selector):
     """Selector of a boolean value."""
 
+    __slots__ = ()
+
     selector_type = "boolean"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
 
     def __init__(self, config: BooleanSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -247,8 +370,7 @@ class BooleanSelector(Selector):
 
     def __call__(self, data: Any) -> bool:
         """Validate the passed selection."""
-        value: bool = vol.Coerce(bool)(data)
-        return value
+        return cv.boolean(data)
 
 
 class ColorRGBSelectorConfig(TypedDict):
@@ -259,9 +381,23 @@ class ColorRGBSelectorConfig(TypedDict):
 class ColorRGBSelector(Selector):
     """Selector of an RGB color value."""
 
+    __slots__ = ()
+
     selector_type = "color_rgb"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
+
+    @staticmethod
+    def _build_data_schema() -> Callable:
+        """Compile the data schema."""
+        schema: Callable = vol.All(list, vol.ExactSequence((cv.byte,) * 3))
+        return schema
 
     def __init__(self, config: ColorRGBSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -269,7 +405,7 @@ class ColorRGBSelector(Selector):
 
     def __call__(self, data: Any) -> list[int]:
         """Validate the passed selection."""
-        value: list[int] = vol.All(list, vol.ExactSequence((cv.byte,) * 3))(data)
+        value: list[int] = type(self).DATA_SCHEMA(data)
         return value
 
 
@@ -284,28 +420,35 @@ class ColorTempSelectorConfig(TypedDict, total=False):
 class ColorTempSelector(Selector):
     """Selector of an color temperature."""
 
+    __slots__ = ("_data_schema",)
+
     selector_type = "color_temp"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {
-            vol.Optional("max_mireds"): vol.Coerce(int),
-            vol.Optional("min_mireds"): vol.Coerce(int),
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {
+                vol.Optional("max_mireds"): vol.Coerce(int),
+                vol.Optional("min_mireds"): vol.Coerce(int),
+            }
+        )
+        return schema
 
     def __init__(self, config: ColorTempSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
         super().__init__(config)
-
-    def __call__(self, data: Any) -> int:
-        """Validate the passed selection."""
-        value: int = vol.All(
+        self._data_schema = vol.All(
             vol.Coerce(float),
             vol.Range(
                 min=self.config.get("min_mireds"),
                 max=self.config.get("max_mireds"),
             ),
-        )(data)
+        )
+
+    def __call__(self, data: Any) -> int:
+        """Validate the passed selection."""
+        value: int = self._data_schema(data)
         return value
 
 
@@ -317,9 +460,17 @@ class DateSelectorConfig(TypedDict):
 class DateSelector(Selector):
     """Selector of a date."""
 
+    __slots__ = ()
+
     selector_type = "date"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
 
     def __init__(self, config: DateSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -339,9 +490,17 @@ class DateTimeSelectorConfig(TypedDict):
 class DateTimeSelector(Selector):
     """Selector of a datetime."""
 
+    __slots__ = ()
+
     selector_type = "datetime"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
 
     def __init__(self, config: DateTimeSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -367,24 +526,31 @@ class DeviceSelectorConfig(TypedDict, total=False):
 class DeviceSelector(Selector):
     """Selector of a single or list of devices."""
 
+    __slots__ = ("_multiple",)
+
     selector_type = "device"
 
-    CONFIG_SCHEMA = SINGLE_DEVICE_SELECTOR_CONFIG_SCHEMA.extend(
-        {vol.Optional("multiple", default=False): cv.boolean}
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = SINGLE_DEVICE_SELECTOR_CONFIG_SCHEMA.extend(
+            {vol.Optional("multiple", default=False): cv.boolean}
+        )
+        return schema
 
     def __init__(self, config: DeviceSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
         super().__init__(config)
+        self._multiple: bool = self.config["multiple"]
 
     def __call__(self, data: Any) -> str | list[str]:
         """Validate the passed selection."""
-        if not self.config["multiple"]:
-            device_id: str = vol.Schema(str)(data)
+        if not self._multiple:
+            device_id: str = _STRING_SCHEMA(data)
             return device_id
         if not isinstance(data, list):
             raise vol.Invalid("Value should be a list")
-        return [vol.Schema(str)(val) for val in data]
+        return list(map(_STRING_SCHEMA, data))
 
 
 class DurationSelectorConfig(TypedDict, total=False):
@@ -397,15 +563,21 @@ class DurationSelectorConfig(TypedDict, total=False):
 class DurationSelector(Selector):
     """Selector for a duration."""
 
+    __slots__ = ()
+
     selector_type = "duration"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {
-            # Enable day field in frontend. A selection with `days` set is allowed
-            # even if `enable_day` is not set
-            vol.Optional("enable_day"): cv.boolean,
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {
+                # Enable day field in frontend. A selection with `days` set is allowed
+                # even if `enable_day` is not set
+                vol.Optional("enable_day"): cv.boolean,
+            }
+        )
+        return schema
 
     def __init__(self, config: DurationSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -429,48 +601,60 @@ class EntitySelectorConfig(SingleEntitySelectorConfig, total=False):
 class EntitySelector(Selector):
     """Selector of a single or list of entities."""
 
+    __slots__ = ("_allowed_domains", "_include", "_exclude", "_multiple")
+
     selector_type = "entity"
 
-    CONFIG_SCHEMA = SINGLE_ENTITY_SELECTOR_CONFIG_SCHEMA.extend(
-        {
-            vol.Optional("exclude_entities"): [str],
-            vol.Optional("include_entities"): [str],
-            vol.Optional("multiple", default=False): cv.boolean,
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = SINGLE_ENTITY_SELECTOR_CONFIG_SCHEMA.extend(
+            {
+                vol.Optional("exclude_entities"): [str],
+                vol.Optional("include_entities"): [str],
+                vol.Optional("multiple", default=False): cv.boolean,
+            }
+        )
+        return schema
 
     def __init__(self, config: EntitySelectorConfig | None = None) -> None:
         """Instantiate a selector."""
         super().__init__(config)
-
-    def __call__(self, data: Any) -> str | list[str]:
-        """Validate the passed selection."""
-
+        self._allowed_domains = cv.ensure_list(self.config.get("domain"))
         include_entities = self.config.get("include_entities")
         exclude_entities = self.config.get("exclude_entities")
-
-        def validate(e_or_u: str) -> str:
-            e_or_u = cv.entity_id_or_uuid(e_or_u)
-            if not valid_entity_id(e_or_u):
-                return e_or_u
-            if allowed_domains := cv.ensure_list(self.config.get("domain")):
-                domain = split_entity_id(e_or_u)[0]
-                if domain not in allowed_domains:
-                    raise vol.Invalid(
-                        f"Entity {e_or_u} belongs to domain {domain}, "
-                        f"expected {allowed_domains}"
-                    )
-            if include_entities:
-                vol.In(include_entities)(e_or_u)
-            if exclude_entities:
-                vol.NotIn(exclude_entities)(e_or_u)
+        self._include = vol.In(include_entities) if include_entities else None
+        self._exclude = vol.NotIn(exclude_entities) if exclude_entities else None
+        self._multiple: bool = self.config["multiple"]
+
+    def _validate_one(self, e_or_u: str) -> str:
+        """Validate a single entity ID or UUID."""
+        e_or_u = cv.entity_id_or_uuid(e_or_u)
+        if not valid_entity_id(e_or_u):
             return e_or_u
+        if self._allowed_domains:
+            # e_or_u passed valid_entity_id, so it has exactly one dot
+            domain = e_or_u.partition(".")[0]
+            if domain not in self._allowed_domains:
+                raise vol.Invalid(
+                    f"Entity {e_or_u} belongs to domain {domain}, "
+                    f"expected {self._allowed_domains}"
+                )
+        if self._include is not None:
+            self._include(e_or_u)
+        if self._exclude is not None:
+            self._exclude(e_or_u)
+        return e_or_u
 
-        if not self.config["multiple"]:
-            return validate(data)
+    def __call__(self, data: Any) -> str | list[str]:
+        """Validate the passed selection."""
+        if not self._multiple:
+            return self._validate_one(data)
         if not isinstance(data, list):
             raise vol.Invalid("Value should be a list")
-        return cast(list, vol.Schema([validate])(data))  # Output is a list
+        # _validate_one already raises vol.Invalid, no need for a voluptuous
+        # list schema wrapping every call
+        return [self._validate_one(val) for val in data]
 
 
 class IconSelectorConfig(TypedDict, total=False):
@@ -483,12 +667,18 @@ class IconSelectorConfig(TypedDict, total=False):
 class IconSelector(Selector):
     """Selector for an icon."""
 
+    __slots__ = ()
+
     selector_type = "icon"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {vol.Optional("placeholder"): str}
-        # Frontend also has a fallbackPath option, this is not used by core
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {vol.Optional("placeholder"): str}
+            # Frontend also has a fallbackPath option, this is not used by core
+        )
+        return schema
 
     def __init__(self, config: IconSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -496,7 +686,7 @@ class IconSelector(Selector):
 
     def __call__(self, data: Any) -> str:
         """Validate the passed selection."""
-        icon: str = vol.Schema(str)(data)
+        icon: str = _STRING_SCHEMA(data)
         return icon
 
 
@@ -511,18 +701,29 @@ class LocationSelectorConfig(TypedDict, total=False):
 class LocationSelector(Selector):
     """Selector for a location."""
 
+    __slots__ = ()
+
     selector_type = "location"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {vol.Optional("radius"): bool, vol.Optional("icon"): str}
-    )
-    DATA_SCHEMA = vol.Schema(
-        {
-            vol.Required("latitude"): float,
-            vol.Required("longitude"): float,
-            vol.Optional("radius"): float,
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {vol.Optional("radius"): bool, vol.Optional("icon"): str}
+        )
+        return schema
+
+    @staticmethod
+    def _build_data_schema() -> Callable:
+        """Compile the data schema."""
+        schema: Callable = vol.Schema(
+            {
+                vol.Required("latitude"): float,
+                vol.Required("longitude"): float,
+                vol.Optional("radius"): float,
+            }
+        )
+        return schema
 
     def __init__(self, config: LocationSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -530,10 +731,15 @@ class LocationSelector(Selector):
 
     def __call__(self, data: Any) -> dict[str, float]:
         """Validate the passed selection."""
-        location: dict[str, float] = self.DATA_SCHEMA(data)
+        location: dict[str, float] = _LOCATION_DATA_SCHEMA(data)
         return location
 
 
+# Bound as module globals so __call__ loads them without a class
+# attribute walk per validation
+_LOCATION_DATA_SCHEMA = LocationSelector.DATA_SCHEMA
+
+
 class MediaSelectorConfig(TypedDict):
     """Class to represent a media selector config."""
 
@@ -542,20 +748,33 @@ class MediaSelectorConfig(TypedDict):
 class MediaSelector(Selector):
     """Selector for media."""
 
+    __slots__ = ()
+
     selector_type = "media"
 
-    CONFIG_SCHEMA = vol.Schema({})
-    DATA_SCHEMA = vol.Schema(
-        {
-            # Although marked as optional in frontend, this field is required
-            vol.Required("entity_id"): cv.entity_id_or_uuid,
-            # Although marked as optional in frontend, this field is required
-            vol.Required("media_content_id"): str,
-            # Although marked as optional in frontend, this field is required
-            vol.Required("media_content_type"): str,
-            vol.Remove("metadata"): dict,
-        }
-    )
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
+
+    @staticmethod
+    def _build_data_schema() -> Callable:
+        """Compile the data schema."""
+        schema: Callable = vol.Schema(
+            {
+                # Although marked as optional in frontend, this field is required
+                vol.Required("entity_id"): cv.entity_id_or_uuid,
+                # Although marked as optional in frontend, this field is required
+                vol.Required("media_content_id"): str,
+                # Although marked as optional in frontend, this field is required
+                vol.Required("media_content_type"): str,
+                vol.Remove("metadata"): dict,
+            }
+        )
+        return schema
 
     def __init__(self, config: MediaSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -563,10 +782,13 @@ class MediaSelector(Selector):
 
     def __call__(self, data: Any) -> dict[str, float]:
         """Validate the passed selection."""
-        media: dict[str, float] = self.DATA_SCHEMA(data)
+        media: dict[str, float] = _MEDIA_DATA_SCHEMA(data)
         return media
 
 
+_MEDIA_DATA_SCHEMA = MediaSelector.DATA_SCHEMA
+
+
 class NumberSelectorConfig(TypedDict, total=False):
     """Class to represent a number selector config."""
 
@@ -599,39 +821,50 @@ def has_min_max_if_slider(data: Any) -> Any:
 class NumberSelector(Selector):
     """Selector of a numeric value."""
 
+    __slots__ = ("_min", "_max")
+
     selector_type = "number"
 
-    CONFIG_SCHEMA = vol.All(
-        vol.Schema(
-            {
-                vol.Optional("min"): vol.Coerce(float),
-                vol.Optional("max"): vol.Coerce(float),
-                # Controls slider steps, and up/down keyboard binding for the box
-                # user input is not rounded
-                vol.Optional("step", default=1): vol.All(
-                    vol.Coerce(float), vol.Range(min=1e-3)
-                ),
-                vol.Optional(CONF_UNIT_OF_MEASUREMENT): str,
-                vol.Optional(CONF_MODE, default=NumberSelectorMode.SLIDER): vol.All(
-                    vol.Coerce(NumberSelectorMode), lambda val: val.value
-                ),
-            }
-        ),
-        has_min_max_if_slider,
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.All(
+            vol.Schema(
+                {
+                    vol.Optional("min"): vol.Coerce(float),
+                    vol.Optional("max"): vol.Coerce(float),
+                    # Controls slider steps, and up/down keyboard binding for the box
+                    # user input is not rounded
+                    vol.Optional("step", default=1): vol.All(
+                        vol.Coerce(float), vol.Range(min=1e-3)
+                    ),
+                    vol.Optional(CONF_UNIT_OF_MEASUREMENT): str,
+                    vol.Optional(CONF_MODE, default=NumberSelectorMode.SLIDER): vol.All(
+                        vol.Coerce(NumberSelectorMode), lambda val: val.value
+                    ),
+                }
+            ),
+            has_min_max_if_slider,
+        )
+        return schema
 
     def __init__(self, config: NumberSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
         super().__init__(config)
+        self._min = self.config.get("min", float("-inf"))
+        self._max = self.config.get("max", float("inf"))
 
     def __call__(self, data: Any) -> float:
         """Validate the passed selection."""
-        value: float = vol.Coerce(float)(data)
+        try:
+            value = float(data)
+        except (TypeError, ValueError) as err:
+            raise vol.Invalid(f"Invalid number {data}") from err
 
-        if "min" in self.config and value < self.config["min"]:
+        if value < self._min:
             raise vol.Invalid(f"Value {value} is too small")
 
-        if "max" in self.config and value > self.config["max"]:
+        if value > self._max:
             raise vol.Invalid(f"Value {value} is too large")
 
         return value
@@ -645,9 +878,17 @@ class ObjectSelectorConfig(TypedDict):
 class ObjectSelector(Selector):
     """Selector for an arbitrary object."""
 
+    __slots__ = ()
+
     selector_type = "object"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
 
     def __init__(self, config: ObjectSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -696,25 +937,28 @@ class SelectSelectorConfig(TypedDict, total=False):
 class SelectSelector(Selector):
     """Selector for an single-choice input select."""
 
+    __slots__ = ("_value_schema", "_multiple")
+
     selector_type = "select"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {
-            vol.Required("options"): vol.All(vol.Any([str], [select_option])),
-            vol.Optional("multiple", default=False): cv.boolean,
-            vol.Optional("custom_value", default=False): cv.boolean,
-            vol.Optional("mode"): vol.All(
-                vol.Coerce(SelectSelectorMode), lambda val: val.value
-            ),
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {
+                vol.Required("options"): vol.All(vol.Any([str], [select_option])),
+                vol.Optional("multiple", default=False): cv.boolean,
+                vol.Optional("custom_value", default=False): cv.boolean,
+                vol.Optional("mode"): vol.All(
+                    vol.Coerce(SelectSelectorMode), lambda val: val.value
+                ),
+            }
+        )
+        return schema
 
     def __init__(self, config: SelectSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
         super().__init__(config)
-
-    def __call__(self, data: Any) -> Any:
-        """Validate the passed selection."""
         options = []
         if self.config["options"]:
             if isinstance(self.config["options"][0], str):
@@ -725,12 +969,16 @@ class SelectSelector(Selector):
         parent_schema = vol.In(options)
         if self.config["custom_value"]:
             parent_schema = vol.Any(parent_schema, str)
+        self._value_schema = parent_schema
+        self._multiple: bool = self.config["multiple"]
 
-        if not self.config["multiple"]:
-            return parent_schema(vol.Schema(str)(data))
+    def __call__(self, data: Any) -> Any:
+        """Validate the passed selection."""
+        if not self._multiple:
+            return self._value_schema(_STRING_SCHEMA(data))
         if not isinstance(data, list):
             raise vol.Invalid("Value should be a list")
-        return [parent_schema(vol.Schema(str)(val)) for val in data]
+        return [self._value_schema(_STRING_SCHEMA(val)) for val in data]
 
 
 class TargetSelectorConfig(TypedDict, total=False):
@@ -747,16 +995,26 @@ class TargetSelector(Selector):
     Value should follow cv.TARGET_SERVICE_FIELDS format.
     """
 
+    __slots__ = ()
+
     selector_type = "target"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {
-            vol.Optional("entity"): SINGLE_ENTITY_SELECTOR_CONFIG_SCHEMA,
-            vol.Optional("device"): SINGLE_DEVICE_SELECTOR_CONFIG_SCHEMA,
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {
+                vol.Optional("entity"): SINGLE_ENTITY_SELECTOR_CONFIG_SCHEMA,
+                vol.Optional("device"): SINGLE_DEVICE_SELECTOR_CONFIG_SCHEMA,
+            }
+        )
+        return schema
 
-    TARGET_SELECTION_SCHEMA = vol.Schema(cv.TARGET_SERVICE_FIELDS)
+    @staticmethod
+    def _build_target_selection_schema() -> Callable:
+        """Compile the selection schema."""
+        schema: Callable = vol.Schema(cv.TARGET_SERVICE_FIELDS)
+        return schema
 
     def __init__(self, config: TargetSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -764,10 +1022,13 @@ class TargetSelector(Selector):
 
     def __call__(self, data: Any) -> dict[str, list[str]]:
         """Validate the passed selection."""
-        target: dict[str, list[str]] = self.TARGET_SELECTION_SCHEMA(data)
+        target: dict[str, list[str]] = _TARGET_SELECTION_SCHEMA(data)
         return target
 
 
+_TARGET_SELECTION_SCHEMA = TargetSelector.TARGET_SELECTION_SCHEMA
+
+
 class TemplateSelectorConfig(TypedDict):
     """Class to represent an template selector config."""
 
@@ -776,9 +1037,17 @@ class TemplateSelectorConfig(TypedDict):
 class TemplateSelector(Selector):
     """Selector for an template."""
 
+    __slots__ = ()
+
     selector_type = "template"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
 
     def __init__(self, config: TemplateSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -820,19 +1089,25 @@ class TextSelectorType(StrEnum):
 class TextSelector(Selector):
     """Selector for a multi-line text string."""
 
+    __slots__ = ()
+
     selector_type = "text"
 
-    CONFIG_SCHEMA = vol.Schema(
-        {
-            vol.Optional("multiline", default=False): bool,
-            vol.Optional("suffix"): str,
-            # The "type" controls the input field in the browser, the resulting
-            # data can be any string so we don't validate it.
-            vol.Optional("type"): vol.All(
-                vol.Coerce(TextSelectorType), lambda val: val.value
-            ),
-        }
-    )
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema(
+            {
+                vol.Optional("multiline", default=False): bool,
+                vol.Optional("suffix"): str,
+                # The "type" controls the input field in the browser, the resulting
+                # data can be any string so we don't validate it.
+                vol.Optional("type"): vol.All(
+                    vol.Coerce(TextSelectorType), lambda val: val.value
+                ),
+            }
+        )
+        return schema
 
     def __init__(self, config: TextSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -840,7 +1115,7 @@ class TextSelector(Selector):
 
     def __call__(self, data: Any) -> str:
         """Validate the passed selection."""
-        text: str = vol.Schema(str)(data)
+        text: str = _STRING_SCHEMA(data)
         return text
 
 
@@ -852,9 +1127,17 @@ class ThemeSelectorConfig(TypedDict):
 class ThemeSelector(Selector):
     """Selector for an theme."""
 
+    __slots__ = ()
+
     selector_type = "theme"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
 
     def __init__(self, config: ThemeSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -862,7 +1145,7 @@ class ThemeSelector(Selector):
 
     def __call__(self, data: Any) -> str:
         """Validate the passed selection."""
-        theme: str = vol.Schema(str)(data)
+        theme: str = _STRING_SCHEMA(data)
         return theme
 
 
@@ -874,9 +1157,17 @@ class TimeSelectorConfig(TypedDict):
 class TimeSelector(Selector):
     """Selector of a time value."""
 
+    __slots__ = ()
+
     selector_type = "time"
 
-    CONFIG_SCHEMA = vol.Schema({})
+    _EMPTY_CONFIG: dict[str, Any] = {}
+
+    @staticmethod
+    def _build_config_schema() -> Callable:
+        """Compile the config schema."""
+        schema: Callable = vol.Schema({})
+        return schema
 
     def __init__(self, config: TimeSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -888,6 +1179,11 @@ class TimeSelector(Selector):
         return cast(str, data)
 
 
+# Snapshot of the registry as a plain dict for the hot lookup path; anything
+# registered after import falls back to SELECTORS in _get_selector_class.
+_SELECTOR_DISPATCH: dict[str, type[Selector]] = dict(SELECTORS)
+_dispatch_get = _SELECTOR_DISPATCH.get
+
 add_representer(
     Selector,
     lambda dumper, value: represent_odict(
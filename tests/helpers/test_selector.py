@@ -272,7 +272,7 @@ def test_addon_selector_schema(schema, valid_selections, invalid_selections):
 
 @pytest.mark.parametrize(
     "schema,valid_selections,invalid_selections",
-    (({}, (1, "one", None), ()),),  # Everything can be coarced to bool
+    (({}, (1, "true", "yes", "on", "enable", True), ("abc", None, [], {})),),
 )
 def test_boolean_selector_schema(schema, valid_selections, invalid_selections):
     """Test boolean selector."""
@@ -646,3 +646,43 @@ def test_datetime_selector_schema(schema, valid_selections, invalid_selections):
 def test_template_selector_schema(schema, valid_selections, invalid_selections):
     """Test template selector."""
     _test_selector("template", schema, valid_selections, invalid_selections)
+
+
+def test_selector_instance_cache():
+    """Test selectors built from equal hashable configs share an instance."""
+    selector_instance = selector.selector({"text": {"multiline": True}})
+    assert selector.selector({"text": {"multiline": True}}) is selector_instance
+    assert selector_instance("abc123") == "abc123"
+    # An equal but differently typed value must not hit the cached instance
+    with pytest.raises(vol.Invalid):
+        selector.selector({"text": {"multiline": 1}})
+
+
+def test_empty_selector_config():
+    """Test a None config produces a working selector with an empty config."""
+    selector_instance = selector.selector({"boolean": None})
+    assert selector_instance.config == {}
+    assert selector_instance("true") is True
+    # Every empty selector must get its own config dict
+    assert selector_instance.config is not selector.selector({"boolean": None}).config
+
+
+def test_selector_registered_after_import():
+    """Test a selector registered after import is still resolved."""
+
+    @selector.SELECTORS.register("late")
+    class LateSelector(selector.Selector):
+        """Test selector registered after import."""
+
+        __slots__ = ()
+
+        selector_type = "late"
+
+        CONFIG_SCHEMA = vol.Schema({})
+
+    try:
+        assert isinstance(selector.selector({"late": {}}), LateSelector)
+    finally:
+        del selector.SELECTORS["late"]
+        # pylint: disable=protected-access
+        selector._SELECTOR_DISPATCH.pop("late", None)